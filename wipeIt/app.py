@@ -57,6 +57,7 @@ def delete_resources():
     try:
         data = request.json
         selections = data.get('selections', {})
+        force_detach = data.get('force_detach') is True
 
         profile = session.get('profile')
         region = session.get('region')
@@ -65,7 +66,7 @@ def delete_resources():
             return jsonify({'error': 'Session expired. Please run inventory again.'}), 400
 
         logger.info(f"Starting deletion for profile={profile}, region={region}")
-        destroyer = AWSDestroyer(profile, region)
+        destroyer = AWSDestroyer(profile, region, force_detach_ebs=force_detach)
 
         all_results = []
 
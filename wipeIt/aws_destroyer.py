@@ -3,7 +3,7 @@ AWS Resource Deletion Module
 Handles deletion of AWS resources with dependency management
 """
 import boto3
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 import time
 
@@ -14,9 +14,15 @@ logger = logging.getLogger(__name__)
 class AWSDestroyer:
     """Handles AWS resource deletion with dependency awareness"""
 
-    def __init__(self, profile_name: str, region: str):
+    # EBS detach polling, matching the boto3 volume_available waiter defaults
+    EBS_POLL_DELAY = 15
+    EBS_POLL_MAX_ATTEMPTS = 40
+    EBS_DESCRIBE_BATCH_SIZE = 200
+
+    def __init__(self, profile_name: str, region: str, force_detach_ebs: bool = False):
         self.profile_name = profile_name
         self.region = region
+        self.force_detach_ebs = force_detach_ebs
         self.session = boto3.Session(profile_name=profile_name, region_name=region)
         self.deletion_results = []
 
@@ -30,10 +36,12 @@ class AWSDestroyer:
             'sqs': self.delete_sqs,
             'ec2': self.delete_ec2,
             'cloudwatch_logs': self.delete_cloudwatch_logs,
-            'ebs': self.delete_ebs,
             's3': self.delete_s3
         }
 
+        if resource_type == 'ebs':
+            return self.delete_ebs_volumes(resource_ids)
+
         if resource_type in deletion_methods:
             for resource_id in resource_ids:
                 result = deletion_methods[resource_type](resource_id)
@@ -109,29 +117,113 @@ class AWSDestroyer:
 
     def delete_ebs(self, volume_id: str) -> Dict:
         """Delete EBS volume"""
+        return self.delete_ebs_volumes([volume_id])[0]
+
+    def delete_ebs_volumes(self, volume_ids: List[str]) -> List[Dict]:
+        """Delete EBS volumes in bulk, detaching attached volumes first
+
+        All detaches are sent up front and the whole set is polled with batched
+        describe_volumes calls; each volume is deleted as soon as it becomes
+        available instead of waiting on one volume at a time.
+        """
+        results = {}
+        unique_ids = list(dict.fromkeys(volume_ids))
+
         try:
             client = self.session.client('ec2')
+            volumes = self._describe_ebs_volumes(client, unique_ids)
+        except Exception as e:
+            logger.error(f"Error describing EBS volumes: {e}")
+            return [self._ebs_result(volume_id, 'failed', str(e)) for volume_id in volume_ids]
 
-            # Check if volume is attached
-            volume = client.describe_volumes(VolumeIds=[volume_id])['Volumes'][0]
+        pending = set()
+        for volume_id in unique_ids:
+            volume = volumes.get(volume_id)
+            if volume is None:
+                results[volume_id] = self._ebs_result(volume_id, 'failed', 'Volume not found')
+                continue
 
-            if volume['Attachments']:
-                # Detach volume first
-                attachment = volume['Attachments'][0]
-                client.detach_volume(VolumeId=volume_id)
-                logger.info(f"Detached volume {volume_id} from {attachment['InstanceId']}")
+            # Nothing to wait on, so delete straight away
+            if not volume['Attachments'] and volume['State'] not in ('in-use', 'creating'):
+                results[volume_id] = self._delete_ebs_volume(client, volume_id)
+                continue
 
-                # Wait for detachment
-                waiter = client.get_waiter('volume_available')
-                waiter.wait(VolumeIds=[volume_id])
+            # Detach volume first, without waiting on it
+            try:
+                for attachment in volume['Attachments']:
+                    if attachment['State'] in ('detaching', 'detached'):
+                        continue
+                    client.detach_volume(
+                        VolumeId=volume_id,
+                        InstanceId=attachment['InstanceId'],
+                        Force=self.force_detach_ebs
+                    )
+                    logger.info(f"Detaching volume {volume_id} from {attachment['InstanceId']}")
+                pending.add(volume_id)
+            except Exception as e:
+                logger.error(f"Error detaching EBS volume {volume_id}: {e}")
+                results[volume_id] = self._ebs_result(volume_id, 'failed', str(e))
 
-            # Delete volume
+        # Wait for detachment, deleting each volume as it becomes available
+        attempts = 0
+        while pending and attempts < self.EBS_POLL_MAX_ATTEMPTS:
+            time.sleep(self.EBS_POLL_DELAY)
+            attempts += 1
+
+            try:
+                volumes = self._describe_ebs_volumes(client, list(pending))
+            except Exception as e:
+                logger.warning(f"Error polling EBS volumes: {e}")
+                continue
+
+            for volume_id in list(pending):
+                volume = volumes.get(volume_id)
+                if volume is None:
+                    results[volume_id] = self._ebs_result(volume_id, 'failed', 'Volume disappeared while detaching')
+                elif volume['State'] in ('available', 'error'):
+                    results[volume_id] = self._delete_ebs_volume(client, volume_id)
+                else:
+                    continue
+                pending.discard(volume_id)
+
+        for volume_id in pending:
+            logger.error(f"Timed out waiting for EBS volume {volume_id} to detach")
+            results[volume_id] = self._ebs_result(volume_id, 'failed', 'Timed out waiting for volume to detach')
+
+        return [results[volume_id] for volume_id in volume_ids]
+
+    def _describe_ebs_volumes(self, client, volume_ids: List[str]) -> Dict[str, Dict]:
+        """Describe EBS volumes in batches, keyed by volume ID
+
+        Uses a volume-id filter rather than VolumeIds so that one missing
+        volume does not fail the whole batch.
+        """
+        volumes = {}
+        paginator = client.get_paginator('describe_volumes')
+        for i in range(0, len(volume_ids), self.EBS_DESCRIBE_BATCH_SIZE):
+            batch = volume_ids[i:i + self.EBS_DESCRIBE_BATCH_SIZE]
+            for page in paginator.paginate(Filters=[{'Name': 'volume-id', 'Values': batch}]):
+                for volume in page['Volumes']:
+                    volumes[volume['VolumeId']] = volume
+        return volumes
+
+    def _delete_ebs_volume(self, client, volume_id: str) -> Dict:
+        """Delete a single available EBS volume"""
+        try:
             client.delete_volume(VolumeId=volume_id)
             logger.info(f"Deleted EBS volume: {volume_id}")
-            return {'resource': volume_id, 'status': 'deleted', 'type': 'ebs'}
+            return self._ebs_result(volume_id, 'deleted')
         except Exception as e:
             logger.error(f"Error deleting EBS volume {volume_id}: {e}")
-            return {'resource': volume_id, 'status': 'failed', 'error': str(e), 'type': 'ebs'}
+            return self._ebs_result(volume_id, 'failed', str(e))
+
+    @staticmethod
+    def _ebs_result(volume_id: str, status: str, error: Optional[str] = None) -> Dict:
+        """Build an EBS deletion result entry"""
+        result = {'resource': volume_id, 'status': status, 'type': 'ebs'}
+        if error is not None:
+            result['error'] = error
+        return result
 
     def delete_s3(self, bucket_name: str) -> Dict:
         """Delete S3 bucket (empties bucket first)"""
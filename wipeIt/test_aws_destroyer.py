@@ -0,0 +1,107 @@
+"""
+Tests for bulk EBS volume deletion in AWSDestroyer
+"""
+import unittest
+from unittest import mock
+
+import boto3
+from botocore.stub import Stubber
+
+from aws_destroyer import AWSDestroyer
+
+
+def volume(volume_id: str, state: str, instance_id: str = None) -> dict:
+    attachments = []
+    if instance_id:
+        attachments.append({'VolumeId': volume_id, 'InstanceId': instance_id, 'State': 'attached'})
+    return {'VolumeId': volume_id, 'State': state, 'Attachments': attachments}
+
+
+def describe_params(volume_ids: list) -> dict:
+    return {'Filters': [{'Name': 'volume-id', 'Values': volume_ids}]}
+
+
+class DeleteEbsVolumesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = boto3.client(
+            'ec2',
+            region_name='us-east-1',
+            aws_access_key_id='testing',
+            aws_secret_access_key='testing'
+        )
+        self.stubber = Stubber(self.client)
+
+        session = mock.Mock()
+        session.client.return_value = self.client
+        with mock.patch('aws_destroyer.boto3.Session', return_value=session):
+            self.destroyer = AWSDestroyer('test', 'us-east-1')
+
+        sleep = mock.patch('aws_destroyer.time.sleep')
+        self.sleep = sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def run_deletion(self, volume_ids: list) -> list:
+        with self.stubber:
+            results = self.destroyer.delete_resources('ebs', volume_ids)
+        self.stubber.assert_no_pending_responses()
+        return results
+
+    def test_available_attached_and_missing_volumes(self):
+        self.stubber.add_response(
+            'describe_volumes',
+            {'Volumes': [volume('vol-a', 'available'), volume('vol-b', 'in-use', 'i-1')]},
+            describe_params(['vol-a', 'vol-b', 'vol-missing'])
+        )
+        self.stubber.add_response('delete_volume', {}, {'VolumeId': 'vol-a'})
+        self.stubber.add_response(
+            'detach_volume', {}, {'VolumeId': 'vol-b', 'InstanceId': 'i-1', 'Force': False}
+        )
+        # First poll still attached, second poll available
+        self.stubber.add_response(
+            'describe_volumes', {'Volumes': [volume('vol-b', 'in-use', 'i-1')]}, describe_params(['vol-b'])
+        )
+        self.stubber.add_response(
+            'describe_volumes', {'Volumes': [volume('vol-b', 'available')]}, describe_params(['vol-b'])
+        )
+        self.stubber.add_response('delete_volume', {}, {'VolumeId': 'vol-b'})
+
+        results = self.run_deletion(['vol-a', 'vol-b', 'vol-missing', 'vol-a'])
+
+        self.assertEqual([r['resource'] for r in results], ['vol-a', 'vol-b', 'vol-missing', 'vol-a'])
+        self.assertEqual([r['status'] for r in results], ['deleted', 'deleted', 'failed', 'deleted'])
+        self.assertEqual(results[2]['error'], 'Volume not found')
+        self.assertEqual(self.sleep.call_count, 2)
+
+    def test_error_volume_is_deleted(self):
+        self.stubber.add_response(
+            'describe_volumes', {'Volumes': [volume('vol-e', 'error')]}, describe_params(['vol-e'])
+        )
+        self.stubber.add_response('delete_volume', {}, {'VolumeId': 'vol-e'})
+
+        results = self.run_deletion(['vol-e'])
+
+        self.assertEqual(results[0]['status'], 'deleted')
+        self.sleep.assert_not_called()
+
+    def test_timeout_waiting_for_detach(self):
+        self.destroyer.EBS_POLL_MAX_ATTEMPTS = 2
+        self.stubber.add_response(
+            'describe_volumes', {'Volumes': [volume('vol-b', 'in-use', 'i-1')]}, describe_params(['vol-b'])
+        )
+        self.stubber.add_response(
+            'detach_volume', {}, {'VolumeId': 'vol-b', 'InstanceId': 'i-1', 'Force': False}
+        )
+        for _ in range(2):
+            self.stubber.add_response(
+                'describe_volumes', {'Volumes': [volume('vol-b', 'in-use', 'i-1')]}, describe_params(['vol-b'])
+            )
+
+        results = self.run_deletion(['vol-b'])
+
+        self.assertEqual(results[0]['status'], 'failed')
+        self.assertEqual(results[0]['error'], 'Timed out waiting for volume to detach')
+
+
+if __name__ == '__main__':
+    unittest.main()